@@ -60,6 +60,31 @@ class Category(Enum):
     TOOLS = 5
 
 
+def _deserialize_available(value) -> bool:
+    """Only accepts a real boolean for the availability"""
+    if not isinstance(value, bool):
+        raise DataValidationError(
+            "Invalid type for boolean [available]: " + str(type(value))
+        )
+    return value
+
+
+def _deserialize_category(value) -> Category:
+    """Creates a Category enum from its name"""
+    return getattr(Category, value)
+
+
+# Fields read by Product.deserialize() in the order they are processed
+_FIELDS = ("name", "description", "price", "available", "category")
+
+# Converters for the fields that are not copied as-is
+_DESERIALIZERS = {
+    "price": Decimal,
+    "available": _deserialize_available,
+    "category": _deserialize_category,
+}
+
+
 class Product(db.Model):
     """
     Class that represents a Product
@@ -130,17 +155,10 @@ class Product(db.Model):
             data (dict): A dictionary containing the Product data
         """
         try:
-            self.name = data["name"]
-            self.description = data["description"]
-            self.price = Decimal(data["price"])
-            if isinstance(data["available"], bool):
-                self.available = data["available"]
-            else:
-                raise DataValidationError(
-                    "Invalid type for boolean [available]: "
-                    + str(type(data["available"]))
-                )
-            self.category = getattr(Category, data["category"])  # create enum from string
+            for field in _FIELDS:
+                value = data[field]
+                converter = _DESERIALIZERS.get(field)
+                setattr(self, field, converter(value) if converter else value)
         except AttributeError as error:
             raise DataValidationError("Invalid attribute: " + error.args[0]) from error
         except KeyError as error:
@@ -30,7 +30,6 @@ class ProductFactory(factory.Factory):
 
         model = Product
 
-    id = factory.Sequence(lambda n: n)
     name = FuzzyChoice(
         choices=[
             "Hat",
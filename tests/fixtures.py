@@ -0,0 +1,45 @@
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test Fixtures shared by all of the test cases in this process
+"""
+import logging
+from functools import lru_cache
+from service import app
+from service.models import init_db
+
+
+@lru_cache(maxsize=None)
+def init_test_app(database_uri: str):
+    """Configures the Flask app and database once per test process
+
+    :param database_uri: the database to run the tests against
+    :type database_uri: str
+
+    :return: the Flask app
+    :rtype: Flask
+
+    """
+    app.config["TESTING"] = True
+    app.config["DEBUG"] = False
+    app.config["SQLALCHEMY_DATABASE_URI"] = database_uri
+    if database_uri.startswith("postgresql"):
+        # test data is throwaway, so commits need not wait for the WAL flush
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+            "connect_args": {"options": "-c synchronous_commit=off"},
+        }
+    app.logger.setLevel(logging.CRITICAL)
+    init_db(app)
+    return app
@@ -30,8 +30,9 @@ from decimal import Decimal
 from unittest import TestCase
 from service import app
 from service.common import status
-from service.models import db, init_db, Product
+from service.models import db, Product
 from tests.factories import ProductFactory
+from tests.fixtures import init_test_app
 
 # Disable all but critical errors during normal test run
 # uncomment for debugging failing tests
@@ -54,12 +55,8 @@ class TestProductRoutes(TestCase):
     @classmethod
     def setUpClass(cls):
         """Run once before all tests"""
-        app.config["TESTING"] = True
-        app.config["DEBUG"] = False
         # Set up the test database
-        app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URI
-        app.logger.setLevel(logging.CRITICAL)
-        init_db(app)
+        init_test_app(DATABASE_URI)
 
     @classmethod
     def tearDownClass(cls):